@@ -7,25 +7,34 @@ within a graphical window.
 
 from __future__ import annotations
 
-from graphics import Line, Point, Window
+from graphics import WALL_OFF, WALL_ON, Window
+
+# indices into Cell.walls
+TOP, RIGHT, BOTTOM, LEFT = range(4)
+# wall colors indexed by whether the wall is standing
+WALL_COLORS = (WALL_OFF, WALL_ON)
 
 
 class Cell:
     """Represents a cell in the maze.
 
     Attributes:
-        has_left_wall (bool): True if the cell has a left wall, False otherwise.
-        has_right_wall (bool): True if the cell has a right wall, False otherwise.
-        has_top_wall (bool): True if the cell has a top wall, False otherwise.
-        has_bottom_wall (bool): True if the cell has a bottom wall, False otherwise.
+        walls (list[bool]): Whether the cell has a wall on each side, indexed by
+            TOP, RIGHT, BOTTOM, and LEFT.
         visited (bool): True if the cell has been visited. Starts out False for all cells.
         _x1 (float | None): The x-coordinate of the top-left corner of the cell.
         _y1 (float | None): The y-coordinate of the top-left corner of the cell.
         _x2 (float | None): The x-coordinate of the bottom-right corner of the cell.
         _y2 (float | None): The y-coordinate of the bottom-right corner of the cell.
         _win (Window | None): The window object where the cell will be drawn, or None if no window is associated.
+        _wall_ids (list[int] | None): The canvas item ids of the walls, indexed like `walls`,
+            or None if the cell has not been drawn yet.
+        _move_ids (dict[Cell, int] | None): The canvas item ids of the move lines drawn from
+            this cell, keyed by the cell moved to, or None if no move has been drawn yet.
     """
 
+    __slots__ = ("_move_ids", "_wall_ids", "_win", "_x1", "_x2", "_y1", "_y2", "visited", "walls")
+
     def __init__(
         self,
         win: Window | None = None,
@@ -36,23 +45,54 @@ class Cell:
             win: The Window object where the cell will be drawn.
                 If None, the cell will not be drawn. Defaults to None.
         """
-        self.has_left_wall = True
-        self.has_right_wall = True
-        self.has_top_wall = True
-        self.has_bottom_wall = True
+        self.walls = [True] * 4
         self.visited = False
         self._x1: float | None = None
         self._y1: float | None = None
         self._x2: float | None = None
         self._y2: float | None = None
         self._win = win
+        self._wall_ids: list[int] | None = None
+        self._move_ids: dict[Cell, int] | None = None
 
-    def draw(self, x1: float, y1: float, x2: float, y2: float) -> None:
-        """Draws the cell on the window.
+    @property
+    def has_left_wall(self) -> bool:
+        """True if the cell has a left wall, False otherwise."""
+        return self.walls[LEFT]
 
-        Draws the walls of the cell based on the has_left_wall,
-        has_right_wall, has_top_wall, and has_bottom_wall attributes.
-        If no window is associated with the cell, this method does nothing.
+    @has_left_wall.setter
+    def has_left_wall(self, value: bool) -> None:
+        self.walls[LEFT] = value
+
+    @property
+    def has_right_wall(self) -> bool:
+        """True if the cell has a right wall, False otherwise."""
+        return self.walls[RIGHT]
+
+    @has_right_wall.setter
+    def has_right_wall(self, value: bool) -> None:
+        self.walls[RIGHT] = value
+
+    @property
+    def has_top_wall(self) -> bool:
+        """True if the cell has a top wall, False otherwise."""
+        return self.walls[TOP]
+
+    @has_top_wall.setter
+    def has_top_wall(self, value: bool) -> None:
+        self.walls[TOP] = value
+
+    @property
+    def has_bottom_wall(self) -> bool:
+        """True if the cell has a bottom wall, False otherwise."""
+        return self.walls[BOTTOM]
+
+    @has_bottom_wall.setter
+    def has_bottom_wall(self, value: bool) -> None:
+        self.walls[BOTTOM] = value
+
+    def set_coords(self, x1: float, y1: float, x2: float, y2: float) -> None:
+        """Sets the position of the cell without drawing it.
 
         Args:
             x1: The x-coordinate of the top-left corner of the cell.
@@ -64,25 +104,47 @@ class Cell:
         self._y1 = y1
         self._x2 = x2
         self._y2 = y2
+
+    def draw(self, x1: float, y1: float, x2: float, y2: float) -> None:
+        """Draws the cell on the window.
+
+        Draws the walls of the cell based on the walls attribute.
+        The wall lines are created on the first call and only recolored on
+        subsequent calls, so redrawing a cell never adds canvas items.
+        If no window is associated with the cell, this method does nothing.
+
+        Args:
+            x1: The x-coordinate of the top-left corner of the cell.
+            y1: The y-coordinate of the top-left corner of the cell.
+            x2: The x-coordinate of the bottom-right corner of the cell.
+            y2: The y-coordinate of the bottom-right corner of the cell.
+        """
+        self.set_coords(x1, y1, x2, y2)
         if self._win is None:
             return
 
-        left_wall_color = "snow" if self.has_left_wall else "gray15"
-        right_wall_color = "snow" if self.has_right_wall else "gray15"
-        top_wall_color = "snow" if self.has_top_wall else "gray15"
-        bottom_wall_color = "snow" if self.has_bottom_wall else "gray15"
+        colors = [WALL_COLORS[has_wall] for has_wall in self.walls]
+        if self._wall_ids is not None:
+            self._win.configure_lines(self._wall_ids, colors)
+            return
+        # top, right, bottom, left
+        segments = ((x1, y1, x2, y1), (x2, y1, x2, y2), (x1, y2, x2, y2), (x1, y1, x1, y2))
+        self._wall_ids = self._win.draw_lines([
+            (*segment, color) for segment, color in zip(segments, colors, strict=True)
+        ])
 
-        self._win.draw_line(Line(Point(x1, y1), Point(x1, y2)), left_wall_color)
-        self._win.draw_line(Line(Point(x2, y1), Point(x2, y2)), right_wall_color)
-        self._win.draw_line(Line(Point(x1, y1), Point(x2, y1)), top_wall_color)
-        self._win.draw_line(Line(Point(x1, y2), Point(x2, y2)), bottom_wall_color)
+    def clear_moves(self) -> None:
+        """Forgets the move lines drawn from this cell, e.g. after the window cleared them."""
+        self._move_ids = None
 
     def draw_move(self, to_cell: Cell, undo: bool = False) -> None:
         """Draws a line representing a move from this cell to another cell.
 
         The line is drawn from the center of this cell to the center of the
         `to_cell`. The color of the line indicates whether the move is being
-        undone. If no window is associated with the cell, this method does nothing.
+        undone; undoing a move recolors the existing line instead of drawing a
+        new one on top of it. If no window is associated with the cell, this
+        method does nothing.
 
         Args:
             to_cell: The cell to move to.
@@ -95,10 +157,20 @@ class Cell:
         if self._win is None:
             return
         line_color = "red" if undo else "SeaGreen1"
+        if self._move_ids is None:
+            self._move_ids = {}
+        move_id = self._move_ids.get(to_cell)
+        if move_id is not None:
+            self._win.configure_line(move_id, line_color)
+            return
         if self._x1 is None or self._y1 is None or self._x2 is None or self._y2 is None:
             raise Exception("cell coordinates not defined")
         if to_cell._x1 is None or to_cell._y1 is None or to_cell._x2 is None or to_cell._y2 is None:
             raise Exception("to_cell coordinates not defined")
-        p1 = Point((self._x1 + self._x2) / 2, (self._y1 + self._y2) / 2)
-        p2 = Point((to_cell._x1 + to_cell._x2) / 2, (to_cell._y1 + to_cell._y2) / 2)
-        self._win.draw_line(Line(p1, p2), line_color)
+        self._move_ids[to_cell] = self._win.draw_move_segment(
+            (self._x1 + self._x2) // 2,
+            (self._y1 + self._y2) // 2,
+            (to_cell._x1 + to_cell._x2) // 2,
+            (to_cell._y1 + to_cell._y2) // 2,
+            line_color,
+        )
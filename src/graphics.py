@@ -6,15 +6,60 @@ can be visualized.
 
 from __future__ import annotations
 
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from os import environ
 from pathlib import Path
 from sys import base_prefix
 
-environ["TCL_LIBRARY"] = str(Path(base_prefix) / "lib" / "tcl8.6")
-environ["TK_LIBRARY"] = str(Path(base_prefix) / "lib" / "tk8.6")
+# point Tcl/Tk at the libraries bundled with the base interpreter, unless the
+# environment already chose them or the interpreter does not bundle them
+if "TCL_LIBRARY" not in environ and (Path(base_prefix) / "lib" / "tcl8.6").is_dir():
+    environ["TCL_LIBRARY"] = str(Path(base_prefix) / "lib" / "tcl8.6")
+if "TK_LIBRARY" not in environ and (Path(base_prefix) / "lib" / "tk8.6").is_dir():
+    environ["TK_LIBRARY"] = str(Path(base_prefix) / "lib" / "tk8.6")
 
-from tkinter import BOTH, Canvas, Tk
+from tkinter import BOTH, NW, Canvas, PhotoImage, Tk
+
+# Tcl procedures that bundle several canvas commands, such as creating,
+# recoloring, or painting a whole batch of lines, so each bundle costs a single
+# Python -> Tcl call instead of one call per command.
+DRAW_LINES_PROC = "::maze_solver::draw_lines"
+CONFIGURE_LINES_PROC = "::maze_solver::configure_lines"
+PAINT_RECTS_PROC = "::maze_solver::paint_rects"
+REUSE_LINE_PROC = "::maze_solver::reuse_line"
+TCL_SCRIPT = f"""
+namespace eval ::maze_solver {{}}
+proc {DRAW_LINES_PROC} {{canvas lines}} {{
+    lmap line $lines {{
+        lassign $line x1 y1 x2 y2 color
+        $canvas create line $x1 $y1 $x2 $y2 -fill $color -width 2
+    }}
+}}
+proc {CONFIGURE_LINES_PROC} {{canvas ids colors}} {{
+    foreach id $ids color $colors {{
+        $canvas itemconfigure $id -fill $color
+    }}
+}}
+proc {PAINT_RECTS_PROC} {{image rects}} {{
+    foreach rect $rects {{
+        lassign $rect x1 y1 x2 y2 color
+        $image put $color -to $x1 $y1 $x2 $y2
+    }}
+}}
+proc {REUSE_LINE_PROC} {{canvas id x1 y1 x2 y2 color}} {{
+    $canvas coords $id $x1 $y1 $x2 $y2
+    $canvas itemconfigure $id -fill $color -state normal
+}}
+"""
+# colors as #RRGGBB so Tk does not have to resolve color names
+WALL_ON = "#fffafa"  # snow
+WALL_OFF = "#262626"  # gray15, the canvas background
+# canvas tag shared by every line in the move pool
+MOVE_TAG = "move"
+FRAME_MS = 16  # milliseconds between runs of scheduled callbacks, about 60 per second
 
 
 class Window:
@@ -23,7 +68,18 @@ class Window:
     Attributes:
         __root (Tk): The root Tkinter window.
         __canvas (Canvas): The canvas for drawing graphics.
-        __running (bool): Indicates whether the window is running.
+        __image (PhotoImage): A bitmap covering the canvas that static lines are
+            painted into, so they cost no canvas items.
+        __tk_call (Callable[..., Any]): The Tcl interpreter's call method, used to
+            issue canvas commands without going through the Tkinter wrappers.
+        __canvas_path (str): The Tcl path name of the canvas widget.
+        __move_pool (list[int]): The canvas item ids of every move line created
+            so far, reused in order after clear_moves.
+        __move_pool_index (int): The index of the next move line to hand out.
+        __scheduled (deque[tuple[Callable[[], object], float]]): Callbacks waiting to
+            run from the Tk event loop, each with the pause that follows it.
+        __drain_id (str | None): The id of the pending Tk timer that will run
+            the scheduled callbacks, or None if none is pending.
     """
 
     def __init__(self, width: int, height: int) -> None:
@@ -35,53 +91,227 @@ class Window:
         """
         self.__root = Tk()
         self.__root.title("Maze Solver")
-        self.__canvas = Canvas(self.__root, bg="gray15", width=width, height=height)
+        self.__canvas = Canvas(self.__root, bg=WALL_OFF, width=width, height=height)
         self.__canvas.pack(fill=BOTH, expand=1)
-        self.__running = False
+        self.__image = PhotoImage(master=self.__root, width=width, height=height)
+        self.__canvas.create_image(0, 0, anchor=NW, image=self.__image)
         self.__root.protocol("WM_DELETE_WINDOW", self.close)
+        self.__root.eval(TCL_SCRIPT)
+        self.__tk_call = self.__canvas.tk.call
+        self.__canvas_path = str(self.__canvas)
+        self.__move_pool: list[int] = []
+        self.__move_pool_index = 0
+        self.__scheduled: deque[tuple[Callable[[], object], float]] = deque()
+        self.__drain_id: str | None = None
 
     def redraw(self) -> None:
         """Redraws the window and updates the display.
 
-        This method forces the Tkinter window to update its contents,
-        ensuring that any changes made to the canvas are visible.
+        This method flushes pending idle tasks, which is where Tk repaints the
+        canvas, without processing the rest of the event queue.
         """
-        self.__root.update()
         self.__root.update_idletasks()
 
     def wait_for_close(self) -> None:
         """Waits for the window to be closed by the user.
 
-        This method enters a loop that continuously redraws the window
-        until the user closes it.
+        This method runs the Tk main loop, which sleeps until there are
+        window events to process, until the user closes the window.
         """
-        self.__running = True
-        while self.__running:
-            self.redraw()
+        self.__root.mainloop()
         print("window closed...")
 
     def close(self) -> None:
         """Closes the window.
 
-        Sets the running flag to False, which will cause the
-        wait_for_close loop to terminate.
+        Stops the Tk main loop, which will cause wait_for_close to return.
+        """
+        self.__root.quit()
+
+    def schedule(self, callback: Callable[[], object], delay: float = 0.0) -> None:
+        """Queues a callback to run from the Tk event loop.
+
+        Queued callbacks run in order from a Tk timer, as many per frame as fit
+        in the frame, so long-running drawing never blocks window events and
+        Tk repaints between frames. The loop must be running, e.g. inside
+        wait_for_close, for the callbacks to run.
+
+        Args:
+            callback: The function to call.
+            delay: Seconds to wait after this callback before running the next
+                one. Defaults to 0.0.
         """
-        self.__running = False
+        self.__scheduled.append((callback, delay))
+        if self.__drain_id is None:
+            self.__drain_id = self.__root.after(FRAME_MS, self.__drain)
 
-    def draw_line(self, line: Line, fill_color: str) -> None:
+    def cancel_scheduled(self) -> None:
+        """Discards every callback that has been scheduled but not yet run."""
+        self.__scheduled.clear()
+        if self.__drain_id is not None:
+            self.__root.after_cancel(self.__drain_id)
+            self.__drain_id = None
+
+    def __drain(self) -> None:
+        """Runs scheduled callbacks until the frame is used up or a delay is requested."""
+        self.__drain_id = None
+        deadline = time.monotonic() + FRAME_MS / 1000
+        while self.__scheduled:
+            callback, delay = self.__scheduled.popleft()
+            callback()
+            if delay > 0:
+                self.__drain_id = self.__root.after(round(delay * 1000), self.__drain)
+                return
+            if time.monotonic() >= deadline:
+                self.__drain_id = self.__root.after(FRAME_MS, self.__drain)
+                return
+
+    def draw_line(self, line: Line, fill_color: str) -> int:
         """Draws a line on the canvas.
 
         Args:
             line: The line object to draw.
             fill_color: The color to fill the line with.
+
+        Returns:
+            The canvas item id of the new line.
+        """
+        return self.draw_segment(line.p1.x, line.p1.y, line.p2.x, line.p2.y, fill_color)
+
+    def draw_segment(self, x1: float, y1: float, x2: float, y2: float, fill_color: str) -> int:
+        """Draws a line segment on the canvas from raw coordinates.
+
+        Unlike draw_line, this does not require building Point and Line objects,
+        which keeps per-move allocations out of the solver loop. The canvas
+        command is issued directly to Tcl, skipping Tkinter's option parsing.
+
+        Args:
+            x1: The x-coordinate of one end of the segment.
+            y1: The y-coordinate of one end of the segment.
+            x2: The x-coordinate of the other end of the segment.
+            y2: The y-coordinate of the other end of the segment.
+            fill_color: The color to fill the line with.
+
+        Returns:
+            The canvas item id of the new line.
+        """
+        return int(
+            self.__tk_call(self.__canvas_path, "create", "line", x1, y1, x2, y2, "-fill", fill_color, "-width", 2)
+        )
+
+    def draw_move_segment(self, x1: float, y1: float, x2: float, y2: float, fill_color: str) -> int:
+        """Draws a move line segment, reusing a pooled canvas line when available.
+
+        Lines hidden by clear_moves are moved into place and recolored instead
+        of being deleted and created again; a new line is only created once
+        the pool is exhausted.
+
+        Args:
+            x1: The x-coordinate of one end of the segment.
+            y1: The y-coordinate of one end of the segment.
+            x2: The x-coordinate of the other end of the segment.
+            y2: The y-coordinate of the other end of the segment.
+            fill_color: The color to fill the line with.
+
+        Returns:
+            The canvas item id of the line.
+        """
+        if self.__move_pool_index < len(self.__move_pool):
+            item_id = self.__move_pool[self.__move_pool_index]
+            self.__tk_call(REUSE_LINE_PROC, self.__canvas_path, item_id, x1, y1, x2, y2, fill_color)
+        else:
+            item_id = int(
+                self.__tk_call(
+                    self.__canvas_path,
+                    "create",
+                    "line",
+                    x1,
+                    y1,
+                    x2,
+                    y2,
+                    "-fill",
+                    fill_color,
+                    "-width",
+                    2,
+                    "-tags",
+                    MOVE_TAG,
+                )
+            )
+            self.__move_pool.append(item_id)
+        self.__move_pool_index += 1
+        return item_id
+
+    def clear_moves(self) -> None:
+        """Hides every move line so that the pool can be reused from the start."""
+        self.__tk_call(self.__canvas_path, "itemconfigure", MOVE_TAG, "-state", "hidden")
+        self.__move_pool_index = 0
+
+    def draw_lines(self, lines: Sequence[tuple[float, float, float, float, str]]) -> list[int]:
+        """Draws a batch of line segments on the canvas.
+
+        All segments are created with a single call into Tcl, bypassing the
+        per-line overhead of the Tkinter wrapper.
+
+        Args:
+            lines: The segments to draw, each given as (x1, y1, x2, y2, fill_color).
+
+        Returns:
+            The canvas item ids of the new lines, in the same order as `lines`.
         """
-        line.draw(self.__canvas, fill_color)
+        item_ids = self.__tk_call(DRAW_LINES_PROC, self.__canvas_path, lines)
+        return [int(item_id) for item_id in self.__canvas.tk.splitlist(item_ids)]
+
+    def paint_lines(self, lines: Sequence[tuple[float, float, float, float, str]]) -> None:
+        """Paints a batch of horizontal or vertical lines into the background image.
 
+        Painted lines are pixels in a single image rather than canvas items, so
+        Tk only has to blit one bitmap however many lines there are. They cannot
+        be changed afterwards, but anything drawn on the canvas covers them.
+        All lines are painted with a single call into Tcl.
 
-@dataclass
+        Args:
+            lines: The axis-aligned segments to paint, each given as
+                (x1, y1, x2, y2, fill_color). Each is painted 2 pixels wide.
+        """
+        # Tk rejects negative -to coordinates but clips the far side to the image
+        rects = [
+            (
+                max(0, round(min(x1, x2)) - 1),
+                max(0, round(min(y1, y2)) - 1),
+                round(max(x1, x2)) + 1,
+                round(max(y1, y2)) + 1,
+                color,
+            )
+            for x1, y1, x2, y2, color in lines
+        ]
+        self.__tk_call(PAINT_RECTS_PROC, str(self.__image), rects)
+
+    def configure_line(self, item_id: int, fill_color: str) -> None:
+        """Changes the color of a line already on the canvas.
+
+        Args:
+            item_id: The canvas item id of the line.
+            fill_color: The new color to fill the line with.
+        """
+        self.__tk_call(self.__canvas_path, "itemconfigure", item_id, "-fill", fill_color)
+
+    def configure_lines(self, item_ids: Sequence[int], fill_colors: Sequence[str]) -> None:
+        """Changes the colors of a batch of lines already on the canvas.
+
+        Args:
+            item_ids: The canvas item ids of the lines.
+            fill_colors: The new colors, one per item id.
+        """
+        self.__tk_call(CONFIGURE_LINES_PROC, self.__canvas_path, item_ids, fill_colors)
+
+
+@dataclass(slots=True, frozen=True)
 class Point:
     """Represents a point in 2D space.
 
+    Kept as a convenience for callers; the window's own drawing paths take
+    raw coordinates instead.
+
     Attributes:
         x: The x-coordinate of the point (0 is the left of the screen).
         y: The y-coordinate of the point (0 is the top of the screen).
@@ -91,29 +321,29 @@ class Point:
     y: float  # y = 0 -> top of the screen
 
 
+@dataclass(slots=True, frozen=True)
 class Line:
     """Represents a line segment in 2D space.
 
+    Kept as a convenience for callers; the window's own drawing paths take
+    raw coordinates instead.
+
     Attributes:
         p1: A point on one end of the line.
         p2: A point on the other end of the line.
     """
 
-    def __init__(self, p1: Point, p2: Point) -> None:
-        """Initializes the Line object.
-
-        Args:
-            p1: A point on one end of the line.
-            p2: A point on the other end of the line.
-        """
-        self.p1 = p1
-        self.p2 = p2
+    p1: Point
+    p2: Point
 
-    def draw(self, canvas: Canvas, fill_color: str) -> None:
+    def draw(self, canvas: Canvas, fill_color: str) -> int:
         """Draws the line on the given canvas.
 
         Args:
             canvas: The canvas to draw the line on.
             fill_color: The color to fill the line with.
+
+        Returns:
+            The canvas item id of the new line.
         """
-        canvas.create_line(self.p1.x, self.p1.y, self.p2.x, self.p2.y, fill=fill_color, width=2)
+        return canvas.create_line(self.p1.x, self.p1.y, self.p2.x, self.p2.y, fill=fill_color, width=2)
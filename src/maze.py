@@ -1,18 +1,19 @@
 """This module defines the Maze class, which represents a grid-based maze.
 
 The Maze class is responsible for creating and managing the cells within the maze,
-drawing them on a graphical window, and generating the maze structure using a
-recursive backtracking algorithm.
+generating the maze structure using a randomized depth-first search, and drawing
+the finished maze on a graphical window.
 """
 
 import random
-import time
-from itertools import product
+from array import array
+from functools import partial
 
-from cell import Cell
-from graphics import Window
+from cell import BOTTOM, LEFT, RIGHT, TOP, Cell
+from graphics import WALL_ON, Window
 
-DIRECTIONS = [("down", 1, 0), ("right", 0, 1), ("up", -1, 0), ("left", 0, -1)]
+# (dy, dx, index of the wall crossed in the current cell, index of the same wall in the neighbor)
+DIRECTIONS = [(1, 0, BOTTOM, TOP), (0, 1, RIGHT, LEFT), (-1, 0, TOP, BOTTOM), (0, -1, LEFT, RIGHT)]
 
 
 class Maze:
@@ -27,8 +28,15 @@ class Maze:
         _cell_size_y (float): The height of each cell in the maze.
         _win (Window | None): The graphical window where the maze will be drawn,
             or None if no window is associated.
-        _cells (list[list[Cell]]): A 2D list of Cell objects representing the
-            maze grid.
+        _cells (list[Cell]): A flat list of Cell objects representing the maze
+            grid in row-major order; the cell at row i, column j is stored at
+            index i * _stride + j.
+        _stride (int): The number of cells per row in _cells.
+        _col_edges (array[int]): The pixel x-coordinates of the column boundaries;
+            column j spans _col_edges[j] to _col_edges[j + 1].
+        _row_edges (array[int]): The pixel y-coordinates of the row boundaries;
+            row i spans _row_edges[i] to _row_edges[i + 1].
+        _animation_delay (float): Seconds to pause after each animation step.
     """
 
     def __init__(
@@ -41,6 +49,8 @@ class Maze:
         cell_size_y: float,
         win: Window | None = None,
         seed: int | None = None,
+        animation_delay: float = 0.0,
+        generate: bool = True,
     ) -> None:
         """Initializes a Maze object.
 
@@ -55,6 +65,11 @@ class Maze:
                 If None, the maze will not be drawn. Defaults to None.
             seed: An optional seed for the random number generator, used for
                 reproducible maze generation. Defaults to None.
+            animation_delay: Seconds to pause after each animation step. When 0,
+                steps are drawn as fast as the window's frame budget allows.
+                Defaults to 0.0.
+            generate: Whether to carve passages and open the entrance and exit.
+                When False, every cell keeps all four walls. Defaults to True.
         """
         self._x1 = x1
         self._y1 = y1
@@ -63,121 +78,182 @@ class Maze:
         self._cell_size_x = cell_size_x
         self._cell_size_y = cell_size_y
         self._win = win
-        self._cells: list[list[Cell]] = []
+        self._cells: list[Cell] = []
+        self._stride = num_cols
+        self._col_edges = array("i")
+        self._row_edges = array("i")
+        self._animation_delay = animation_delay
 
         if seed is not None:
             random.seed(seed)
 
         self._create_cells()
-        self._break_entrance_and_exit()
-        self._break_walls_r(0, 0)
-        self._reset_cells_visited()
+        if generate:
+            self._break_walls(0, 0)
+            self._break_entrance_and_exit()
+            self._reset_cells_visited()
+        self._render_final()
 
     def solve(self) -> bool:
-        """Solves the maze using a recursive backtracking algorithm.
+        """Solves the maze using depth-first search.
+
+        The search runs to completion without touching the window, and the
+        moves it made are then queued to be replayed by the window's event
+        loop. Any moves drawn or queued by a previous call are cleared first,
+        so the maze can be solved again.
 
         Returns:
             True if a solution is found, False otherwise.
         """
-        return self._solve_r(0, 0)
-
-    def _is_valid_move(self, i: int, j: int, dy: int, dx: int) -> bool:
-        """Checks if a move to a neighboring cell is valid.
+        self._reset_cells_visited()
+        if self._win is not None:
+            self._win.cancel_scheduled()
+            self._win.clear_moves()
+            for cell in self._cells:
+                cell.clear_moves()
+        solved, moves = self._solve_iter(0, 0)
+        self._draw_moves(moves)
+        return solved
+
+    def _solve_iter(self, i: int, j: int) -> tuple[bool, list[tuple[int, int, bool]]]:
+        """Solves the maze from a given cell using depth-first search.
+
+        The search keeps the current path on an explicit stack instead of
+        recursing, so large mazes cannot exhaust the interpreter's recursion
+        limit. Each stack entry holds the iterator over the directions that
+        remain to be tried from that cell. Nothing is drawn; every move is
+        recorded so that it can be rendered afterwards.
 
         Args:
-            i: The current row index.
-            j: The current column index.
-            dy: The change in row index.
-            dx: The change in column index.
+            i: The row index of the starting cell.
+            j: The column index of the starting cell.
 
         Returns:
-            True if the move is valid, False otherwise.
+            A tuple of whether a solution was found and the moves made, in
+            order, as (from cell index, to cell index, undo) tuples.
         """
-        new_y, new_x = i + dy, j + dx
-        if not (0 <= new_y < self._num_rows and 0 <= new_x < self._num_cols):
-            return False
-        next_cell = self._cells[new_y][new_x]
-        return not next_cell.visited
+        cells, stride = self._cells, self._stride
+        moves: list[tuple[int, int, bool]] = []
+        cells[i * stride + j].visited = True
+        stack = [(i, j, iter(DIRECTIONS))]
+        while stack:
+            i, j, directions = stack[-1]
+            if i == self._num_rows - 1 and j == self._num_cols - 1:
+                return True, moves
+
+            index = i * stride + j
+            current_cell = cells[index]
+            for dy, dx, wall, _ in directions:
+                new_y, new_x = i + dy, j + dx
+                if (
+                    current_cell.walls[wall]
+                    or not (0 <= new_y < self._num_rows and 0 <= new_x < self._num_cols)
+                    or cells[new_y * stride + new_x].visited
+                ):
+                    continue
 
-    def _has_wall_in_direction(self, cell: Cell, direction: str) -> bool:
-        """Checks if the current cell has a wall in the given direction.
+                cells[new_y * stride + new_x].visited = True
+                moves.append((index, new_y * stride + new_x, False))
+                stack.append((new_y, new_x, iter(DIRECTIONS)))
+                break
+            else:
+                # dead end: backtrack to the previous cell on the path
+                stack.pop()
+                if stack:
+                    prev_y, prev_x, _ = stack[-1]
+                    moves.append((prev_y * stride + prev_x, index, True))
 
-        Args:
-            cell: The current cell.
-            direction: The direction to check.
+        return False, moves
 
-        Returns:
-            True if there is a wall in the given direction, False otherwise.
+    def _draw_moves(self, moves: list[tuple[int, int, bool]]) -> None:
+        """Schedules the moves made by the solver to be drawn one step at a time.
 
-        Raises:
-            ValueError: If an invalid direction is supplied as an argument.
-        """
-        match direction:
-            case "up":
-                return cell.has_top_wall
-            case "down":
-                return cell.has_bottom_wall
-            case "left":
-                return cell.has_left_wall
-            case "right":
-                return cell.has_right_wall
-            case _:
-                raise ValueError(f"Invalid direction: {direction}")
-
-    def _solve_r(self, i: int, j: int) -> bool:
-        """Recursively solves the maze from a given cell.
+        Each move is queued on the window and drawn from its event loop, which
+        paces the animation and keeps the window responsive while it plays.
+        If no window is associated with the maze, this method does nothing.
 
         Args:
-            i: The row index of the current cell.
-            j: The column index of the current cell.
-
-        Returns:
-            True if a solution is found from this cell, False otherwise.
+            moves: The moves to draw, as returned by _solve_iter.
         """
-        self._animate()
-        current_cell = self._cells[i][j]
-        current_cell.visited = True
-
-        if i == self._num_rows - 1 and j == self._num_cols - 1:
-            return True
-
-        for direction, dy, dx in DIRECTIONS:
-            if self._has_wall_in_direction(current_cell, direction):
-                continue
+        if self._win is None:
+            return
+        cells = self._cells
+        for from_index, to_index, undo in moves:
+            self._win.schedule(partial(cells[from_index].draw_move, cells[to_index], undo), self._animation_delay)
 
-            if not self._is_valid_move(i, j, dy, dx):
-                continue
+    def _cell(self, i: int, j: int) -> Cell:
+        """Returns the cell at the specified row and column.
 
-            new_y, new_x = i + dy, j + dx
-            next_cell = self._cells[new_y][new_x]
-            current_cell.draw_move(next_cell)
-            if self._solve_r(new_y, new_x):
-                return True
-            else:
-                current_cell.draw_move(next_cell, undo=True)
+        Args:
+            i: The row index of the cell.
+            j: The column index of the cell.
 
-        return False
+        Returns:
+            The cell at row i, column j.
+        """
+        return self._cells[i * self._stride + j]
 
     def _create_cells(self) -> None:
-        """Creates and draws all cells in the maze.
+        """Creates all cells in the maze.
 
-        Iterates through each cell position in the grid and calls _draw_cell
-        to create and draw the cell.
+        Computes the pixel boundaries of every row and column once, rounded to
+        integers, then iterates through each cell position in the grid, creating
+        the cell and setting its coordinates. Nothing is drawn until the maze is
+        complete. Without a window the coordinates are never used, so only the
+        cells are created.
         """
-        for _ in range(self._num_rows):
-            row = []
-            for _ in range(self._num_cols):
-                row.append(Cell(self._win))
-            self._cells.append(row)
+        self._col_edges = array("i", [round(self._x1 + j * self._cell_size_x) for j in range(self._num_cols + 1)])
+        self._row_edges = array("i", [round(self._y1 + i * self._cell_size_y) for i in range(self._num_rows + 1)])
+        self._cells = [Cell(self._win) for _ in range(self._num_rows * self._num_cols)]
+        if self._win is None:
+            return
 
-        for i, j in product(range(self._num_rows), range(self._num_cols)):
-            self._draw_cell(i, j)
+        cells, stride = self._cells, self._stride
+        cols, rows = self._col_edges, self._row_edges
+        for i in range(self._num_rows):
+            row_offset = i * stride
+            y1, y2 = rows[i], rows[i + 1]
+            for j in range(self._num_cols):
+                cells[row_offset + j].set_coords(cols[j], y1, cols[j + 1], y2)
+
+    def _render_final(self) -> None:
+        """Paints the walls of the finished maze with a single batched call.
+
+        Walks the grid once, collecting each wall segment that is still standing.
+        Shared walls are collected once, from the top and left sides of each cell
+        plus the outer right and bottom edges. The walls are painted into the
+        window's background image, so they add no canvas items. Open walls are
+        not painted, since the canvas background already has their color.
+        If no window is associated with the maze, this method does nothing.
+        """
+        if self._win is None:
+            return
+        cells, stride = self._cells, self._stride
+        cols, rows = self._col_edges, self._row_edges
+        last_row, last_col = self._num_rows - 1, self._num_cols - 1
+        lines: list[tuple[float, float, float, float, str]] = []
+        append = lines.append
+        for i in range(self._num_rows):
+            row_offset = i * stride
+            y1, y2 = rows[i], rows[i + 1]
+            for j in range(self._num_cols):
+                walls = cells[row_offset + j].walls
+                x1, x2 = cols[j], cols[j + 1]
+                if walls[TOP]:
+                    append((x1, y1, x2, y1, WALL_ON))
+                if walls[LEFT]:
+                    append((x1, y1, x1, y2, WALL_ON))
+                if walls[RIGHT] and j == last_col:
+                    append((x2, y1, x2, y2, WALL_ON))
+                if walls[BOTTOM] and i == last_row:
+                    append((x1, y2, x2, y2, WALL_ON))
+        self._win.paint_lines(lines)
 
     def _draw_cell(self, i: int, j: int) -> None:
         """Draws a single cell at the specified row and column.
 
-        Calculates the coordinates of the cell based on its position in the grid
-        and the cell size, then draws the cell using its draw method.
+        Looks up the precomputed pixel boundaries of the cell's row and column,
+        then draws the cell using its draw method.
         If no window is associated with the maze, this method does nothing.
 
         Args:
@@ -186,86 +262,56 @@ class Maze:
         """
         if self._win is None:
             return
-        x1 = self._x1 + j * self._cell_size_x
-        y1 = self._y1 + i * self._cell_size_y
-        x2 = x1 + self._cell_size_x
-        y2 = y1 + self._cell_size_y
-        self._cells[i][j].draw(x1, y1, x2, y2)
-        # self._animate()
-
-    def _animate(self) -> None:
-        """Animates the drawing of the maze.
-
-        Redraws the window and pauses briefly to create an animation effect.
-        If no window is associated with the maze, this method does nothing.
-        """
-        if self._win is None:
-            return
-        self._win.redraw()
-        time.sleep(0.05)
+        self._cell(i, j).draw(self._col_edges[j], self._row_edges[i], self._col_edges[j + 1], self._row_edges[i + 1])
 
     def _break_entrance_and_exit(self) -> None:
         """Breaks the entrance and exit walls of the maze.
 
         Removes the left wall of the top-left cell to create an entrance,
         and removes the right wall of the bottom-right cell to create an exit.
-        Then redraws the cells to reflect the changes.
+        Only the wall flags change; the openings are drawn by _render_final.
         """
         # entrance
-        self._cells[0][0].has_left_wall = False
-        self._draw_cell(0, 0)
+        self._cell(0, 0).walls[LEFT] = False
         # exit
-        m, n = self._num_rows - 1, self._num_cols - 1
-        self._cells[m][n].has_right_wall = False
-        self._draw_cell(m, n)
+        self._cell(self._num_rows - 1, self._num_cols - 1).walls[RIGHT] = False
 
-    def _break_walls_r(self, i: int, j: int) -> None:
-        """Recursively breaks down walls to generate the maze structure.
+    def _break_walls(self, i: int, j: int) -> None:
+        """Breaks down walls to generate the maze structure.
 
-        This method implements a recursive backtracking algorithm to carve out
-        passages in the maze. It starts at a given cell and randomly chooses
-        unvisited neighboring cells to move to, breaking down the walls between
-        them.
+        This method implements a randomized depth-first search to carve out
+        passages in the maze. It starts at a given cell and moves to unvisited
+        neighboring cells in a random order, breaking down the walls between
+        them. The current path is kept on an explicit stack instead of
+        recursing, so large mazes cannot exhaust the recursion limit.
 
         Args:
-            i: The row index of the current cell.
-            j: The column index of the current cell.
+            i: The row index of the starting cell.
+            j: The column index of the starting cell.
         """
-        current_cell = self._cells[i][j]
-        current_cell.visited = True
-        while True:
-            to_visit = []
-            for direction, dy, dx in DIRECTIONS:
+        cells, stride = self._cells, self._stride
+        cells[i * stride + j].visited = True
+        # each cell tries its neighbors in an order shuffled once, on first visit
+        stack = [(i, j, iter(random.sample(DIRECTIONS, len(DIRECTIONS))))]
+        while stack:
+            i, j, directions = stack[-1]
+            current_cell = cells[i * stride + j]
+            for dy, dx, wall, to_wall in directions:
                 new_y, new_x = i + dy, j + dx
-                if (
-                    0 <= new_x < self._num_cols
-                    and 0 <= new_y < self._num_rows
-                    and not self._cells[new_y][new_x].visited
-                ):
-                    to_visit.append((direction, dy, dx))
-            if not to_visit:
-                self._draw_cell(i, j)
-                return
-            # pick a random direction to go
-            direction, dy, dx = random.choice(to_visit)
-            to_cell = self._cells[i + dy][j + dx]
-            match direction:
-                case "up":
-                    current_cell.has_top_wall = False
-                    to_cell.has_bottom_wall = False
-                case "down":
-                    current_cell.has_bottom_wall = False
-                    to_cell.has_top_wall = False
-                case "left":
-                    current_cell.has_left_wall = False
-                    to_cell.has_right_wall = False
-                case "right":
-                    current_cell.has_right_wall = False
-                    to_cell.has_left_wall = False
-            self._draw_cell(i, j)
-            self._break_walls_r(i + dy, j + dx)
+                if not (0 <= new_x < self._num_cols and 0 <= new_y < self._num_rows):
+                    continue
+                to_cell = cells[new_y * stride + new_x]
+                if to_cell.visited:
+                    continue
+                current_cell.walls[wall] = False
+                to_cell.walls[to_wall] = False
+                to_cell.visited = True
+                stack.append((new_y, new_x, iter(random.sample(DIRECTIONS, len(DIRECTIONS)))))
+                break
+            else:
+                stack.pop()
 
     def _reset_cells_visited(self) -> None:
         """Reset the visited property of all the cells in the Maze to False."""
-        for i, j in product(range(self._num_rows), range(self._num_cols)):
-            self._cells[i][j].visited = False
+        for cell in self._cells:
+            cell.visited = False
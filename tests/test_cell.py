@@ -0,0 +1,67 @@
+from unittest.mock import MagicMock
+
+from cell import Cell
+from graphics import WALL_OFF, WALL_ON, Window
+
+
+def test_cell_draw_batches_walls():
+    """Tests that the first draw creates all four walls with one batched call."""
+    mock_win = MagicMock(spec=Window)
+    mock_win.draw_lines.return_value = [1, 2, 3, 4]
+    cell = Cell(mock_win)
+    cell.has_left_wall = False
+    cell.draw(0, 0, 10, 20)
+    mock_win.draw_lines.assert_called_once_with([
+        (0, 0, 10, 0, WALL_ON),
+        (10, 0, 10, 20, WALL_ON),
+        (0, 20, 10, 20, WALL_ON),
+        (0, 0, 0, 20, WALL_OFF),
+    ])
+    assert cell._wall_ids == [1, 2, 3, 4]
+
+
+def test_cell_redraw_recolors_walls():
+    """Tests that drawing a cell again recolors its walls instead of creating new lines."""
+    mock_win = MagicMock(spec=Window)
+    mock_win.draw_lines.return_value = [1, 2, 3, 4]
+    cell = Cell(mock_win)
+    cell.draw(0, 0, 10, 20)
+    cell.has_bottom_wall = False
+    cell.draw(0, 0, 10, 20)
+    mock_win.draw_lines.assert_called_once()
+    mock_win.configure_lines.assert_called_once_with([1, 2, 3, 4], [WALL_ON, WALL_ON, WALL_OFF, WALL_ON])
+
+
+def test_cell_undo_move_recolors_line():
+    """Tests that undoing a move recolors the line drawn for that move."""
+    mock_win = MagicMock(spec=Window)
+    mock_win.draw_move_segment.return_value = 7
+    cell = Cell(mock_win)
+    to_cell = Cell(mock_win)
+    cell.draw(0, 0, 10, 10)
+    to_cell.draw(10, 0, 20, 10)
+    cell.draw_move(to_cell)
+    cell.draw_move(to_cell, undo=True)
+    mock_win.draw_move_segment.assert_called_once_with(5, 5, 15, 5, "SeaGreen1")
+    mock_win.configure_line.assert_called_once_with(7, "red")
+
+
+def test_cell_has_no_instance_dict():
+    """Tests that cells use slots instead of a per-instance __dict__."""
+    cell = Cell()
+    assert not hasattr(cell, "__dict__")
+
+
+def test_cell_creates_move_ids_on_first_move():
+    """Tests that a cell only allocates its move id table once a move is drawn."""
+    mock_win = MagicMock(spec=Window)
+    mock_win.draw_move_segment.return_value = 7
+    cell = Cell(mock_win)
+    to_cell = Cell(mock_win)
+    cell.draw(0, 0, 10, 10)
+    to_cell.draw(10, 0, 20, 10)
+    assert cell._move_ids is None
+    cell.draw_move(to_cell)
+    assert cell._move_ids == {to_cell: 7}
+    cell.clear_moves()
+    assert cell._move_ids is None
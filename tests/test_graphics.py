@@ -0,0 +1,24 @@
+from unittest.mock import Mock
+
+from graphics import PAINT_RECTS_PROC, WALL_ON, Window
+from maze import Maze
+
+
+def test_paint_lines_clamps_rects_at_origin():
+    """Tests that walls on pixel row or column 0 are painted from 0, not -1."""
+    mock_win = Mock(spec=Window)
+    Maze(0, 0, 2, 2, 10, 10, mock_win, generate=False)
+    (lines,) = mock_win.paint_lines.call_args.args
+
+    # a Window without a Tk root: paint_lines only needs the Tcl call and the image name
+    win = Window.__new__(Window)
+    win._Window__tk_call = Mock()
+    win._Window__image = "image1"
+    win.paint_lines(lines)
+
+    win._Window__tk_call.assert_called_once()
+    proc, image, rects = win._Window__tk_call.call_args.args
+    assert (proc, image) == (PAINT_RECTS_PROC, "image1")
+    assert (0, 0, 11, 1, WALL_ON) in rects
+    assert (0, 0, 1, 11, WALL_ON) in rects
+    assert all(x1 >= 0 and y1 >= 0 for x1, y1, _, _, _ in rects)
@@ -1,17 +1,38 @@
-from unittest.mock import MagicMock
+from unittest.mock import Mock, call, patch
 
-from graphics import Window
+import pytest
+
+from cell import Cell
+from graphics import WALL_ON, Window
 from maze import Maze
 
 
-def test_maze_create_cells():
-    """Tests that the _create_cells method creates the correct number of cells."""
-    num_rows = 5
-    num_cols = 3
-    maze = Maze(0, 0, num_rows, num_cols, 10, 10)
-    assert len(maze._cells) == num_rows
-    for row in maze._cells:
-        assert len(row) == num_cols
+def _walls(maze):
+    """Collects the walls of every cell in a maze.
+
+    Returns:
+        list[tuple[bool, ...]]: The walls of each cell, in row-major order.
+    """
+    return [tuple(cell.walls) for cell in maze._cells]
+
+
+@pytest.fixture(scope="module")
+def tiny_maze():
+    """Builds an ungenerated 2x2 maze without a window once per module.
+
+    Returns:
+        Maze: A maze shared by read-only tests.
+    """
+    return Maze(50, 50, 2, 2, 10, 10, generate=False)
+
+
+@pytest.mark.parametrize(("num_rows", "num_cols"), [(5, 3), (2, 2), (3, 4)])
+def test_maze_create_cells(num_rows, num_cols):
+    """Tests that a maze without a window creates the correct number of cells."""
+    maze = Maze(0, 0, num_rows, num_cols, 10, 10, generate=False)
+    assert maze._win is None
+    assert len(maze._cells) == num_rows * num_cols
+    assert maze._stride == num_cols
 
 
 def test_maze_draw_cell():
@@ -20,137 +41,130 @@ def test_maze_draw_cell():
     num_cols = 2
     cell_size_x = 10
     cell_size_y = 10
-    mock_win = MagicMock(spec=Window)
-    maze = Maze(50, 50, num_rows, num_cols, cell_size_x, cell_size_y, mock_win)
-
-    # Check that the draw method was called for each cell
-    for i in range(num_rows):
-        for j in range(num_cols):
-            x1 = 50 + j * cell_size_x
-            y1 = 50 + i * cell_size_y
-            x2 = x1 + cell_size_x
-            y2 = y1 + cell_size_y
-            maze._cells[i][j].draw = MagicMock()
-            maze._draw_cell(i, j)
-            maze._cells[i][j].draw.assert_called_once_with(x1, y1, x2, y2)
-
-
-def test_maze_draw_cell_no_window():
+    mock_win = Mock()
+    maze = Maze(50, 50, num_rows, num_cols, cell_size_x, cell_size_y, mock_win, generate=False)
+    expected = [
+        call(50 + j * cell_size_x, 50 + i * cell_size_y, 60 + j * cell_size_x, 60 + i * cell_size_y)
+        for i in range(num_rows)
+        for j in range(num_cols)
+    ]
+
+    with patch.object(Cell, "draw") as mock_draw:
+        for i in range(num_rows):
+            for j in range(num_cols):
+                maze._draw_cell(i, j)
+
+    # Check that the draw method was called once for each cell, in order
+    assert mock_draw.mock_calls == expected
+
+
+def test_maze_draw_cell_no_window(tiny_maze):
     """Tests that _draw_cell does nothing when no window is provided."""
-    num_rows = 2
-    num_cols = 2
-    cell_size_x = 10
-    cell_size_y = 10
-    maze = Maze(50, 50, num_rows, num_cols, cell_size_x, cell_size_y)
+    with patch.object(Cell, "draw") as mock_draw:
+        for i in range(tiny_maze._num_rows):
+            for j in range(tiny_maze._num_cols):
+                tiny_maze._draw_cell(i, j)
 
-    # Check that the draw method was not called for each cell
-    for i in range(num_rows):
-        for j in range(num_cols):
-            maze._cells[i][j].draw = MagicMock()
-            maze._draw_cell(i, j)
-            maze._cells[i][j].draw.assert_not_called()
+    # Check that the draw method was never called
+    assert mock_draw.called is False
 
 
-def test_maze_animate():
-    """Tests that the _animate method calls redraw on the window."""
-    mock_win = MagicMock(spec=Window)
-    maze = Maze(0, 0, 2, 2, 10, 10, mock_win)
+def test_maze_draw_moves():
+    """Tests that _draw_moves schedules each move on the window with the animation delay."""
+    mock_win = Mock(spec=Window)
+    maze = Maze(0, 0, 2, 2, 10, 10, mock_win, animation_delay=0.05, generate=False)
     mock_win.reset_mock()
-    maze._animate()
-    mock_win.redraw.assert_called_once()
-
+    cells = maze._cells
+    with patch.object(Cell, "draw_move", autospec=True) as mock_draw_move:
+        maze._draw_moves([(0, 1, False), (1, 3, False), (1, 3, True)])
+        mock_draw_move.assert_not_called()
+        for callback, delay in (call_args.args for call_args in mock_win.schedule.call_args_list):
+            assert delay == pytest.approx(0.05)
+            callback()
 
-def test_maze_animate_no_window():
-    """Tests that _animate does nothing when no window is provided."""
-    maze = Maze(0, 0, 2, 2, 10, 10)
-    maze._animate()
-    # No error should be raised, and no method should be called
+    # Check that each scheduled callback draws its move between the right cells
+    assert mock_draw_move.mock_calls == [
+        call(cells[0], cells[1], False),
+        call(cells[1], cells[3], False),
+        call(cells[1], cells[3], True),
+    ]
 
 
-def test_maze_init_no_window():
-    """Tests that a maze can be initialized without a window."""
-    maze = Maze(0, 0, 2, 2, 10, 10)
-    assert maze._win is None
-    assert len(maze._cells) == 2
-    for row in maze._cells:
-        assert len(row) == 2
+def test_maze_draw_moves_no_window(tiny_maze):
+    """Tests that _draw_moves does nothing when no window is provided."""
+    with patch.object(Cell, "draw_move") as mock_draw_move:
+        tiny_maze._draw_moves([(0, 1, False)])
+    assert mock_draw_move.called is False
 
 
 def test_break_entrance_and_exit():
     """Tests that _break_entrance_and_exit removes the correct walls."""
     num_rows = 3
     num_cols = 4
-    mock_win = MagicMock(spec=Window)
-    maze = Maze(0, 0, num_rows, num_cols, 10, 10, mock_win)
+    maze = Maze(0, 0, num_rows, num_cols, 10, 10, generate=False)
+    maze._break_entrance_and_exit()
 
     # Check that the walls have been removed
-    assert maze._cells[0][0].has_left_wall is False
-    assert maze._cells[num_rows - 1][num_cols - 1].has_right_wall is False
+    assert maze._cell(0, 0).has_left_wall is False
+    assert maze._cell(num_rows - 1, num_cols - 1).has_right_wall is False
 
 
-def test_break_entrance_and_exit_draw_called():
-    """Tests that _break_entrance_and_exit calls _draw_cell on the correct cells."""
-    num_rows = 3
-    num_cols = 4
-    mock_win = MagicMock(spec=Window)
-    maze = Maze(0, 0, num_rows, num_cols, 10, 10, mock_win)
-    maze._draw_cell = MagicMock()
+def test_break_entrance_and_exit_draws_nothing():
+    """Tests that _break_entrance_and_exit leaves drawing to the final render."""
+    mock_win = Mock(spec=Window)
+    maze = Maze(0, 0, 3, 4, 10, 10, mock_win)
 
-    maze._break_entrance_and_exit()
+    # Check that the maze was painted once, with no cell lines drawn on top
+    mock_win.paint_lines.assert_called_once()
+    mock_win.draw_lines.assert_not_called()
 
-    # Check that _draw_cell was called on the entrance and exit cells
-    maze._draw_cell.assert_any_call(0, 0)
-    maze._draw_cell.assert_any_call(num_rows - 1, num_cols - 1)
-    assert maze._draw_cell.call_count == 2
+    with patch.object(Cell, "draw") as mock_draw:
+        maze._break_entrance_and_exit()
+    assert mock_draw.called is False
 
 
-def test_break_walls_r_all_cells_visited():
-    """Tests that _break_walls_r visits all cells in the maze."""
+def test_break_walls_all_cells_visited():
+    """Tests that _break_walls visits all cells in the maze."""
     num_rows = 3
     num_cols = 4
-    maze = Maze(0, 0, num_rows, num_cols, 10, 10)
-    maze._break_walls_r(0, 0)
+    maze = Maze(0, 0, num_rows, num_cols, 10, 10, generate=False)
+    maze._break_walls(0, 0)
 
     # Check that all cells have been visited
-    for i in range(num_rows):
-        for j in range(num_cols):
-            assert maze._cells[i][j].visited is True
+    assert all(cell.visited is True for cell in maze._cells)
 
 
-def test_break_walls_r_breaks_walls():
-    """Tests that _break_walls_r breaks walls between cells."""
+def test_break_walls_breaks_walls():
+    """Tests that _break_walls breaks walls between cells."""
     num_rows = 2
     num_cols = 2
-    maze = Maze(0, 0, num_rows, num_cols, 10, 10, seed=1)
+    maze = Maze(0, 0, num_rows, num_cols, 10, 10, seed=2)
 
     # Check that walls have been broken
-    assert maze._cells[0][0].has_right_wall is True
-    assert maze._cells[0][1].has_left_wall is True
-    assert maze._cells[0][1].has_bottom_wall is False
-    assert maze._cells[1][1].has_top_wall is False
-    assert maze._cells[1][0].has_right_wall is False
-    assert maze._cells[1][1].has_left_wall is False
-    assert maze._cells[0][0].has_bottom_wall is False
-    assert maze._cells[1][0].has_top_wall is False
+    assert maze._cell(0, 0).has_right_wall is True
+    assert maze._cell(0, 1).has_left_wall is True
+    assert maze._cell(0, 1).has_bottom_wall is False
+    assert maze._cell(1, 1).has_top_wall is False
+    assert maze._cell(1, 0).has_right_wall is False
+    assert maze._cell(1, 1).has_left_wall is False
+    assert maze._cell(0, 0).has_bottom_wall is False
+    assert maze._cell(1, 0).has_top_wall is False
 
 
 def test_reset_cells_visited():
     """Tests that _reset_cells_visited resets the visited property of all cells to False."""
     num_rows = 3
     num_cols = 4
-    maze = Maze(0, 0, num_rows, num_cols, 10, 10)
+    maze = Maze(0, 0, num_rows, num_cols, 10, 10, generate=False)
 
     # Set all cells to visited
-    for i in range(num_rows):
-        for j in range(num_cols):
-            maze._cells[i][j].visited = True
+    for cell in maze._cells:
+        cell.visited = True
 
     maze._reset_cells_visited()
 
     # Check that all cells are now unvisited
-    for i in range(num_rows):
-        for j in range(num_cols):
-            assert maze._cells[i][j].visited is False
+    assert all(cell.visited is False for cell in maze._cells)
 
 
 def test_maze_creation_with_seed():
@@ -162,9 +176,86 @@ def test_maze_creation_with_seed():
     maze2 = Maze(0, 0, num_rows, num_cols, 10, 10, seed=seed)
 
     # Check that the mazes are the same
-    for i in range(num_rows):
-        for j in range(num_cols):
-            assert maze1._cells[i][j].has_left_wall == maze2._cells[i][j].has_left_wall
-            assert maze1._cells[i][j].has_right_wall == maze2._cells[i][j].has_right_wall
-            assert maze1._cells[i][j].has_top_wall == maze2._cells[i][j].has_top_wall
-            assert maze1._cells[i][j].has_bottom_wall == maze2._cells[i][j].has_bottom_wall
+    assert _walls(maze1) == _walls(maze2)
+
+
+@pytest.mark.slow
+def test_maze_large_generate_and_solve():
+    """Tests that mazes larger than the recursion limit can be generated and solved."""
+    maze = Maze(0, 0, 50, 50, 10, 10, seed=0)
+    assert all(cell.visited is False for cell in maze._cells)
+    assert maze.solve() is True
+
+
+def test_solve_draws_recorded_moves():
+    """Tests that solve replays every recorded move on the window."""
+    mock_win = Mock(spec=Window)
+    mock_win.schedule.side_effect = lambda callback, delay: callback()
+    maze = Maze(0, 0, 3, 4, 10, 10, mock_win, seed=0)
+    solved, moves = maze._solve_iter(0, 0)
+    maze._reset_cells_visited()
+    with patch.object(Cell, "draw_move") as mock_draw_move:
+        assert maze.solve() is solved is True
+    assert mock_draw_move.call_count == len(moves)
+    assert moves[-1][1] == len(maze._cells) - 1
+
+
+def test_render_final_paints_standing_walls_once():
+    """Tests that _render_final paints each standing wall once in a single batch."""
+    num_rows = 3
+    num_cols = 4
+    mock_win = Mock(spec=Window)
+    maze = Maze(0, 0, num_rows, num_cols, 10, 10, mock_win, seed=0)
+    mock_win.reset_mock()
+    maze._render_final()
+
+    mock_win.paint_lines.assert_called_once()
+    (lines,) = mock_win.paint_lines.call_args.args
+    expected = sum(
+        maze._cell(i, j).has_top_wall
+        + maze._cell(i, j).has_left_wall
+        + (maze._cell(i, j).has_right_wall and j == num_cols - 1)
+        + (maze._cell(i, j).has_bottom_wall and i == num_rows - 1)
+        for i in range(num_rows)
+        for j in range(num_cols)
+    )
+    assert len(lines) == expected
+    assert all(line[4] == WALL_ON for line in lines)
+
+
+def test_maze_cell_coords_are_integer_pixels():
+    """Tests that cell bounds are rounded to shared integer pixel edges."""
+    mock_win = Mock()
+    maze = Maze(50, 50, 3, 3, 700 / 3, 10.5, mock_win, generate=False)
+    with patch.object(Cell, "draw") as mock_draw:
+        maze._draw_cell(0, 1)
+    mock_draw.assert_called_once_with(283, 50, 517, 60)
+    assert all(type(edge) is int for edge in (*maze._col_edges, *maze._row_edges))
+
+
+def test_solve_again_clears_previous_moves():
+    """Tests that solving again clears the previous moves and finds the same solution."""
+    mock_win = Mock(spec=Window)
+    mock_win.schedule.side_effect = lambda callback, delay: callback()
+    maze = Maze(0, 0, 3, 4, 10, 10, mock_win, seed=0)
+    assert maze.solve() is True
+    first_calls = mock_win.draw_move_segment.call_args_list
+    mock_win.reset_mock()
+
+    assert maze.solve() is True
+    mock_win.cancel_scheduled.assert_called_once()
+    mock_win.clear_moves.assert_called_once()
+    assert mock_win.draw_move_segment.call_args_list == first_calls
+
+
+def test_maze_without_generation_keeps_all_walls(tiny_maze):
+    """Tests that a maze built with generate=False leaves every wall standing."""
+    assert all(all(cell.walls) for cell in tiny_maze._cells)
+    assert not any(cell.visited for cell in tiny_maze._cells)
+
+
+def test_maze_no_window_skips_cell_coords():
+    """Tests that a maze without a window does not spend time placing its cells."""
+    with patch.object(Cell, "set_coords") as mock_set_coords:
+        Maze(0, 0, 3, 4, 10, 10, generate=False)
+    mock_set_coords.assert_not_called()